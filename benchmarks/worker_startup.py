@@ -0,0 +1,54 @@
+"""Benchmark worker cold-start time up to a built crawler.
+
+Each run starts a fresh interpreter that resolves the spider through the
+registry, imports it and builds its crawler, which is the work src.main does
+before the reactor starts. A bare interpreter start is timed as the floor.
+Reaching the first request additionally needs a live Redis queue and is not
+measured here.
+
+Run from the repository root (or inside the scraper image):
+
+    python -m benchmarks.worker_startup --spider ecommerce --runs 10
+"""
+import sys
+import time
+import argparse
+import statistics
+import subprocess
+
+BARE_STARTUP = "pass"
+
+CRAWLER_STARTUP = """
+from src.main import get_spider_class
+spider_class = get_spider_class({spider!r})
+from scrapy.crawler import CrawlerProcess
+from scrapy.utils.project import get_project_settings
+CrawlerProcess(get_project_settings()).create_crawler(spider_class)
+"""
+
+def time_cold_start(snippet):
+    """Time a fresh interpreter running a startup snippet"""
+    start = time.perf_counter()
+    subprocess.run([sys.executable, '-c', snippet], check=True,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark worker cold-start time')
+    parser.add_argument('--spider', help='Name of the spider to load', default='ecommerce')
+    parser.add_argument('--runs', help='Number of cold starts per path', type=int, default=10)
+
+    args = parser.parse_args()
+
+    paths = {
+        'bare': BARE_STARTUP,
+        'crawler': CRAWLER_STARTUP.format(spider=args.spider),
+    }
+    for label, snippet in paths.items():
+        timings = [time_cold_start(snippet) for _ in range(args.runs)]
+        print(f"{label:>8}: median {statistics.median(timings) * 1000:.0f}ms, "
+              f"min {min(timings) * 1000:.0f}ms, max {max(timings) * 1000:.0f}ms "
+              f"over {args.runs} runs")
+
+if __name__ == '__main__':
+    main()
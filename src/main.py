@@ -1,23 +1,36 @@
 import os
 import sys
 import argparse
-from scrapy.crawler import CrawlerProcess
-from scrapy.utils.project import get_project_settings
-from scrapy_redis.spiders import RedisSpider
-from redis import Redis
+import importlib
+
+# Allow `python src/main.py` as well as `python -m src.main`
+if not __package__:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.spiders.registry import resolve_spider
+
+# The crawler entry points and redis are imported where they are used. Spider
+# modules still import Scrapy and scrapy-redis at class definition, so loading
+# a valid spider pulls in that stack; only --help and unknown names skip it.
 
 def configure_redis():
     """Configure Redis connection"""
+    from redis import Redis
     redis_host = os.getenv('REDIS_HOST', 'localhost')
     redis_port = int(os.getenv('REDIS_PORT', 6379))
     return Redis(host=redis_host, port=redis_port)
 
 def get_spider_class(spider_name):
-    """Dynamically load spider class"""
-    module_path = f'src.spiders.{spider_name}'
+    """Load a spider class by its `name` via the spider registry"""
+    spider_path = resolve_spider(spider_name)
+    if spider_path is None:
+        print(f"Error loading spider: unknown spider {spider_name!r}")
+        sys.exit(1)
+
+    module_path, class_name = spider_path.split(':')
     try:
-        module = __import__(module_path, fromlist=[spider_name])
-        return getattr(module, spider_name)
+        module = importlib.import_module(module_path)
+        return getattr(module, class_name)
     except (ImportError, AttributeError) as e:
         print(f"Error loading spider: {e}")
         sys.exit(1)
@@ -30,6 +43,12 @@ def main():
     
     args = parser.parse_args()
 
+    # Resolve the spider first so unknown names fail before the crawler stack loads
+    spider_class = get_spider_class(args.spider)
+
+    from scrapy.crawler import CrawlerProcess
+    from scrapy.utils.project import get_project_settings
+
     # Configure Redis
     redis_client = configure_redis()
 
@@ -40,8 +59,7 @@ def main():
     settings.set('SCHEDULER', 'scrapy_redis.scheduler.Scheduler')
     settings.set('DUPEFILTER_CLASS', 'scrapy_redis.dupefilter.RFPDupeFilter')
 
-    # Load and run spider
-    spider_class = get_spider_class(args.spider)
+    # Run spider
     process = CrawlerProcess(settings)
     process.crawl(spider_class)
     process.start()
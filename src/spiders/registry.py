@@ -0,0 +1,117 @@
+import os
+import ast
+import json
+import logging
+import tempfile
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SPIDERS_DIR = os.path.dirname(os.path.abspath(__file__))
+SPIDERS_PACKAGE = 'src.spiders'
+REGISTRY_FILE = os.path.join(SPIDERS_DIR, 'spider_registry.json')
+
+def _module_fingerprint() -> Dict[str, float]:
+    """Map each spider module file to its modification time"""
+    return {
+        filename: os.path.getmtime(os.path.join(SPIDERS_DIR, filename))
+        for filename in sorted(os.listdir(SPIDERS_DIR))
+        if filename.endswith('.py') and filename not in ('__init__.py', 'registry.py')
+    }
+
+def _is_spider_class(node: ast.ClassDef) -> bool:
+    """Check whether a class derives from a `*Spider` base"""
+    for base in node.bases:
+        base_name = base.attr if isinstance(base, ast.Attribute) else getattr(base, 'id', '')
+        if base_name.endswith('Spider'):
+            return True
+    return False
+
+def _declared_name(node: ast.ClassDef) -> Optional[str]:
+    """Return the string `name` assigned in a class body, if any
+
+    Only names declared on the class itself are found; a `name` inherited
+    from a base class is not resolved.
+    """
+    for statement in node.body:
+        if isinstance(statement, ast.Assign):
+            targets = statement.targets
+        elif isinstance(statement, ast.AnnAssign):
+            targets = [statement.target]
+        else:
+            continue
+        if (any(isinstance(t, ast.Name) and t.id == 'name' for t in targets)
+                and isinstance(statement.value, ast.Constant)
+                and isinstance(statement.value.value, str)):
+            return statement.value.value
+    return None
+
+def _spider_names(path: str) -> List[Tuple[str, str]]:
+    """Find spider classes declaring a `name` in a module without importing it"""
+    with open(path, encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename=path)
+
+    spiders = []
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and _is_spider_class(node):
+            name = _declared_name(node)
+            if name is not None:
+                spiders.append((name, node.name))
+    return spiders
+
+def build_registry() -> Dict:
+    """Scan spider modules and write the name -> module:class registry to disk"""
+    fingerprint = _module_fingerprint()
+    spiders = {}
+    for filename in fingerprint:
+        module = f"{SPIDERS_PACKAGE}.{filename[:-3]}"
+        # A broken module only loses its own spiders, not the whole registry
+        try:
+            module_spiders = _spider_names(os.path.join(SPIDERS_DIR, filename))
+        except (SyntaxError, ValueError, OSError) as e:
+            logger.warning(f"Skipping spider module {filename}: {e}")
+            continue
+        for name, class_name in module_spiders:
+            spider_path = f"{module}:{class_name}"
+            if name in spiders:
+                logger.warning(
+                    f"Duplicate spider name {name!r}: {spider_path} overrides {spiders[name]}"
+                )
+            spiders[name] = spider_path
+
+    registry = {'fingerprint': fingerprint, 'spiders': spiders}
+    # Write to a temp file and swap it in so concurrent readers never see a partial file
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=SPIDERS_DIR, prefix='.spider_registry.', suffix='.tmp')
+        try:
+            os.chmod(tmp_path, 0o644)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(registry, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, REGISTRY_FILE)
+        except OSError:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        logger.warning(f"Could not write spider registry: {e}")
+    return registry
+
+def load_registry() -> Dict[str, str]:
+    """Load the cached registry, rebuilding it if spider modules changed"""
+    try:
+        with open(REGISTRY_FILE, encoding='utf-8') as f:
+            registry = json.load(f)
+        if (isinstance(registry, dict)
+                and isinstance(registry.get('spiders'), dict)
+                and registry.get('fingerprint') == _module_fingerprint()):
+            return registry['spiders']
+    except (OSError, ValueError):
+        pass
+    return build_registry()['spiders']
+
+def resolve_spider(spider_name: str) -> Optional[str]:
+    """Return the `module:class` path registered for a spider name"""
+    return load_registry().get(spider_name)
+
+if __name__ == '__main__':
+    for name, path in sorted(build_registry()['spiders'].items()):
+        print(f"{name} -> {path}")
@@ -0,0 +1,252 @@
+import io
+import json
+import hashlib
+import logging
+import functools
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+import psycopg2
+from psycopg2 import sql
+from psycopg2.extras import Json, RealDictCursor
+from psycopg2.pool import ThreadedConnectionPool
+
+class PostgresStorage:
+    """PostgreSQL storage implementation for scraped data"""
+
+    def __init__(self, connection_string: str, pool_size: int = 10):
+        self.pool = ThreadedConnectionPool(1, pool_size, connection_string)
+        # getconn raises once the pool is exhausted, so borrowers wait here instead
+        self._pool_slots = threading.BoundedSemaphore(pool_size)
+        self.logger = logging.getLogger(__name__)
+        # Serialize query parameters the same way bulk_insert serializes items
+        self._dumps = functools.partial(json.dumps, default=str)
+
+        # Table names
+        self.collections = {
+            'products': 'ecommerce_products',
+            'financial_data': 'financial_records',
+            'logs': 'scraping_logs'
+        }
+
+        # Fields identifying the same item across scrapes; None hashes the whole item
+        self.key_fields = {
+            'products': ('url',),
+            'financial_data': ('url', 'timestamp'),
+            'logs': None
+        }
+
+        # Daily partitions already known to exist, per table
+        self._partitions = set()
+        self._create_tables()
+
+    @contextmanager
+    def _connection(self):
+        """Borrow a pooled connection, committing on success"""
+        with self._pool_slots:
+            conn = self.pool.getconn()
+            try:
+                with conn:
+                    yield conn
+            finally:
+                self.pool.putconn(conn)
+
+    def _create_tables(self):
+        """Create the date-partitioned parent tables if missing"""
+        with self._connection() as conn, conn.cursor() as cursor:
+            for table in self.collections.values():
+                cursor.execute(sql.SQL("""
+                    CREATE TABLE IF NOT EXISTS {} (
+                        item_key TEXT NOT NULL,
+                        scrape_date DATE NOT NULL,
+                        data JSONB NOT NULL,
+                        created_at TIMESTAMP NOT NULL,
+                        updated_at TIMESTAMP,
+                        PRIMARY KEY (item_key, scrape_date)
+                    ) PARTITION BY RANGE (scrape_date)
+                """).format(sql.Identifier(table)))
+
+    def _ensure_partitions(self, table: str, days) -> None:
+        """Create the daily partitions of a table for the given scrape dates"""
+        missing = [day for day in days if (table, day) not in self._partitions]
+        if not missing:
+            return
+        with self._connection() as conn, conn.cursor() as cursor:
+            for day in missing:
+                partition = f"{table}_{day:%Y%m%d}"
+                # IF NOT EXISTS alone still races between writers; serialize per partition
+                cursor.execute("SELECT pg_advisory_xact_lock(hashtext(%s))", (partition,))
+                cursor.execute(sql.SQL(
+                    "CREATE TABLE IF NOT EXISTS {} PARTITION OF {} FOR VALUES FROM (%s) TO (%s)"
+                ).format(sql.Identifier(partition), sql.Identifier(table)),
+                    (day, day + timedelta(days=1)))
+        self._partitions.update((table, day) for day in missing)
+
+    def _item_key(self, collection_name: str, item: Dict) -> str:
+        """Build the conflict key identifying an item"""
+        fields = self.key_fields[collection_name]
+        # Without every key field, fall back to the whole item so distinct items never merge
+        if fields is None or any(item.get(field) is None for field in fields):
+            source = json.dumps(item, sort_keys=True, default=str)
+        else:
+            source = '\x1f'.join(str(item.get(field)) for field in fields)
+        return hashlib.md5(source.encode('utf-8')).hexdigest()
+
+    def _has_operator(self, query) -> bool:
+        """Check whether a query uses Mongo-style `$` operators"""
+        if isinstance(query, dict):
+            return any(
+                (isinstance(k, str) and k.startswith('$')) or self._has_operator(v)
+                for k, v in query.items()
+            )
+        if isinstance(query, list):
+            return any(self._has_operator(v) for v in query)
+        return False
+
+    def _strip_nul(self, value):
+        """Remove NUL characters, which JSONB cannot store"""
+        if isinstance(value, str):
+            return value.replace('\x00', '')
+        if isinstance(value, dict):
+            return {self._strip_nul(k): self._strip_nul(v) for k, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [self._strip_nul(v) for v in value]
+        return value
+
+    def _copy_buffer(self, collection_name: str, data: List[Dict], now: datetime) -> io.StringIO:
+        """Serialize items into COPY text format"""
+        buffer = io.StringIO()
+        created_at = now.isoformat()
+        scrape_date = now.date().isoformat()
+        for ordinal, item in enumerate(data):
+            item = self._strip_nul(item)
+            # JSON escapes control characters, so only backslashes need escaping
+            document = json.dumps(item, default=str).replace('\\', '\\\\')
+            buffer.write(
+                f"{self._item_key(collection_name, item)}\t{scrape_date}\t{document}\t{created_at}\t{ordinal}\n"
+            )
+        buffer.seek(0)
+        return buffer
+
+    def insert_data(self, collection_name: str, data: Dict) -> bool:
+        """Insert a single item into the specified table"""
+        return self.bulk_insert(collection_name, [data])
+
+    def bulk_insert(self, collection_name: str, data: List[Dict]) -> bool:
+        """Insert multiple items via COPY into a staging table, merged on conflict"""
+        try:
+            if collection_name not in self.collections:
+                raise ValueError(f"Invalid collection name: {collection_name}")
+            if not data:
+                return True
+
+            table = self.collections[collection_name]
+            now = datetime.utcnow()
+            buffer = self._copy_buffer(collection_name, data, now)
+
+            self._ensure_partitions(table, [now.date()])
+            with self._connection() as conn, conn.cursor() as cursor:
+                cursor.execute("""
+                    CREATE TEMP TABLE IF NOT EXISTS staging_items (
+                        item_key TEXT,
+                        scrape_date DATE,
+                        data JSONB,
+                        created_at TIMESTAMP,
+                        ordinal INTEGER
+                    ) ON COMMIT DELETE ROWS
+                """)
+                cursor.copy_expert(
+                    "COPY staging_items (item_key, scrape_date, data, created_at, ordinal) FROM STDIN",
+                    buffer
+                )
+                # DISTINCT ON keeps the last row per key so ON CONFLICT never hits a row twice
+                cursor.execute(sql.SQL("""
+                    INSERT INTO {} (item_key, scrape_date, data, created_at)
+                    SELECT DISTINCT ON (item_key, scrape_date) item_key, scrape_date, data, created_at
+                    FROM staging_items
+                    ORDER BY item_key, scrape_date, ordinal DESC
+                    ON CONFLICT (item_key, scrape_date)
+                    DO UPDATE SET data = EXCLUDED.data, updated_at = EXCLUDED.created_at
+                """).format(sql.Identifier(table)))
+            return True
+        except psycopg2.Error as e:
+            self.logger.error(f"Error in bulk insert: {e}")
+            return False
+
+    def update_data(self, collection_name: str, query: Dict, update: Dict) -> bool:
+        """Update items matching the query; only the `$set` operator is supported"""
+        try:
+            if collection_name not in self.collections:
+                raise ValueError(f"Invalid collection name: {collection_name}")
+            unsupported = set(update) - {'$set'}
+            if unsupported:
+                raise ValueError(f"Unsupported update operators: {sorted(unsupported)}")
+            if self._has_operator(query):
+                raise ValueError(f"Unsupported query operators in: {query}")
+
+            table = self.collections[collection_name]
+            with self._connection() as conn, conn.cursor() as cursor:
+                cursor.execute(sql.SQL("""
+                    UPDATE {} SET data = data || %s::jsonb, updated_at = %s
+                    WHERE data @> %s::jsonb
+                """).format(sql.Identifier(table)),
+                    (Json(update['$set'], dumps=self._dumps), datetime.utcnow(),
+                     Json(query, dumps=self._dumps)))
+            return True
+        except psycopg2.Error as e:
+            self.logger.error(f"Error updating data: {e}")
+            return False
+
+    def find_data(self, collection_name: str, query: Dict, limit: int = 100) -> List[Dict]:
+        """Find items containing the query, including their created_at/updated_at
+
+        Queries are matched by JSONB containment, so `$` operators are not supported.
+        """
+        try:
+            if collection_name not in self.collections:
+                raise ValueError(f"Invalid collection name: {collection_name}")
+            if self._has_operator(query):
+                raise ValueError(f"Unsupported query operators in: {query}")
+
+            table = self.collections[collection_name]
+            with self._connection() as conn, conn.cursor() as cursor:
+                cursor.execute(sql.SQL(
+                    "SELECT data, created_at, updated_at FROM {} WHERE data @> %s::jsonb LIMIT %s"
+                ).format(sql.Identifier(table)), (Json(query, dumps=self._dumps), limit))
+                results = []
+                for data, created_at, updated_at in cursor.fetchall():
+                    data['created_at'] = created_at
+                    if updated_at is not None:
+                        data['updated_at'] = updated_at
+                    results.append(data)
+                return results
+        except psycopg2.Error as e:
+            self.logger.error(f"Error finding data: {e}")
+            return []
+
+    def get_collection_stats(self, collection_name: str) -> Optional[Dict]:
+        """Get statistics about a table"""
+        try:
+            if collection_name not in self.collections:
+                raise ValueError(f"Invalid collection name: {collection_name}")
+
+            table = self.collections[collection_name]
+            with self._connection() as conn, conn.cursor(cursor_factory=RealDictCursor) as cursor:
+                cursor.execute(sql.SQL("""
+                    SELECT COUNT(*) AS count,
+                           MIN(created_at) AS first_insert,
+                           MAX(created_at) AS last_insert
+                    FROM {}
+                """).format(sql.Identifier(table)))
+                stats = cursor.fetchone()
+                # Match MongoStorage, which returns None for an empty collection
+                return dict(stats) if stats['count'] else None
+        except psycopg2.Error as e:
+            self.logger.error(f"Error getting collection stats: {e}")
+            return None
+
+    def close(self):
+        """Close all pooled PostgreSQL connections"""
+        self.pool.closeall()